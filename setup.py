@@ -50,7 +50,6 @@ setuptools.setup(
     keywords="telegram, bot, telegram bot, payments, payments check",
     platforms=["any"],
     classifiers=[
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -60,5 +59,5 @@ setuptools.setup(
         "Operating System :: OS Independent",
         "Intended Audience :: Developers",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 )
@@ -21,7 +21,10 @@
 #
 # Imports
 #
+import functools
 import logging
+import os
+from typing import Any
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -45,9 +48,8 @@ class _BotConfigUtils:
     # Read file
     @staticmethod
     def ReadFile(file_name: str) -> str:
-        with open(file_name, "r", encoding="utf-8") as fin:
-            file_data = fin.read()
-        return file_data
+        # Modification time is part of the cache key, so the file is read again only if changed
+        return _BotConfigUtils.__ReadFileCached(file_name, os.stat(file_name).st_mtime_ns)
 
     # Get if column indexes are valid
     @staticmethod
@@ -59,27 +61,54 @@ class _BotConfigUtils:
                 curr_col > _BotConfigUtils.COL_MAX_VAL):
             return False
 
-        # Get other indexes that are already available
-        columns = []
-        for column in (BotConfigTypes.PAYMENT_EMAIL_COL,
-                       BotConfigTypes.PAYMENT_USER_COL,
-                       BotConfigTypes.PAYMENT_EXPIRATION_COL):
-            if config.IsValueSet(column):
-                columns.append(config.GetValue(column))
+        # The current column shall be different from the already set ones
+        return curr_col not in {config.GetValue(column)
+                                for column in (BotConfigTypes.PAYMENT_EMAIL_COL,
+                                               BotConfigTypes.PAYMENT_USER_COL,
+                                               BotConfigTypes.PAYMENT_EXPIRATION_COL)
+                                if config.IsValueSet(column)}
+
+    # Read file (cached)
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def __ReadFileCached(file_name: str,
+                         mtime_ns: int) -> str:
+        with open(file_name, "r", encoding="utf-8") as fin:
+            file_data = fin.read()
+        return file_data
+
+
+# Predicate for checking if a configuration value is equal to the specified one
+class _ConfigValueEquals:
+
+    __slots__ = ("config_type", "value")
 
-        # Check columns if any
-        if len(columns) > 0:
-            # The current column shall be different from the already present ones
-            for col in columns:
-                if curr_col == col:
-                    return False
-        return True
+    config_type: BotConfigTypes
+    value: Any
+
+    # Constructor
+    def __init__(self,
+                 config_type: BotConfigTypes,
+                 value: Any) -> None:
+        self.config_type = config_type
+        self.value = value
+
+    # Check predicate
+    def __call__(self,
+                 config: ConfigObject) -> bool:
+        return config.GetValue(self.config_type) == self.value
 
 
 #
 # Variables
 #
 
+# Predicates shared by configuration fields
+_IsPaymentTypeExcel = _ConfigValueEquals(BotConfigTypes.PAYMENT_TYPE, PaymentTypes.EXCEL_FILE)
+_IsPaymentTypeGoogleSheet = _ConfigValueEquals(BotConfigTypes.PAYMENT_TYPE, PaymentTypes.GOOGLE_SHEET)
+_IsEmailEnabled = _ConfigValueEquals(BotConfigTypes.EMAIL_ENABLED, True)
+_IsLogFileEnabled = _ConfigValueEquals(BotConfigTypes.LOG_FILE_ENABLED, True)
+
 # Logging level converter
 LoggingLevelConverter = KeyValueConverter({
     "DEBUG": logging.DEBUG,
@@ -173,30 +202,30 @@ BotConfig: ConfigSectionsType = {
         {
             "type": BotConfigTypes.PAYMENT_EXCEL_FILE,
             "name": "payment_excel_file",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.PAYMENT_TYPE) == PaymentTypes.EXCEL_FILE,
+            "load_if": _IsPaymentTypeExcel,
         },
         {
             "type": BotConfigTypes.PAYMENT_GOOGLE_SHEET_ID,
             "name": "payment_google_sheet_id",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.PAYMENT_TYPE) == PaymentTypes.GOOGLE_SHEET,
+            "load_if": _IsPaymentTypeGoogleSheet,
         },
         {
             "type": BotConfigTypes.PAYMENT_GOOGLE_CRED_TYPE,
             "name": "payment_google_cred_type",
             "def_val": GoogleCredTypes.OAUTH2,
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.PAYMENT_TYPE) == PaymentTypes.GOOGLE_SHEET,
+            "load_if": _IsPaymentTypeGoogleSheet,
             "conv_fct": lambda val: GoogleCredTypes[val.upper()],
             "print_fct": lambda val: val.name.upper(),
         },
         {
             "type": BotConfigTypes.PAYMENT_GOOGLE_CRED,
             "name": "payment_google_cred",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.PAYMENT_TYPE) == PaymentTypes.GOOGLE_SHEET,
+            "load_if": _IsPaymentTypeGoogleSheet,
         },
         {
             "type": BotConfigTypes.PAYMENT_GOOGLE_CRED_PATH,
             "name": "payment_google_cred_path",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.PAYMENT_TYPE) == PaymentTypes.GOOGLE_SHEET,
+            "load_if": _IsPaymentTypeGoogleSheet,
         },
         {
             "type": BotConfigTypes.PAYMENT_USE_USER_ID,
@@ -249,46 +278,46 @@ BotConfig: ConfigSectionsType = {
         {
             "type": BotConfigTypes.EMAIL_FROM,
             "name": "email_from",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_REPLY_TO,
             "name": "email_reply_to",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_HOST,
             "name": "email_host",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_USER,
             "name": "email_user",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_PASSWORD,
             "name": "email_password",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_SUBJECT,
             "name": "email_subject",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_ALT_BODY,
             "name": "email_alt_body",
             "conv_fct": _BotConfigUtils.ReadFile,
             "print_fct": lambda val: "file successfully loaded",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
         {
             "type": BotConfigTypes.EMAIL_HTML_BODY,
             "name": "email_html_body",
             "conv_fct": _BotConfigUtils.ReadFile,
             "print_fct": lambda val: "file successfully loaded",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.EMAIL_ENABLED),
+            "load_if": _IsEmailEnabled,
         },
     ],
     # Logging
@@ -315,13 +344,13 @@ BotConfig: ConfigSectionsType = {
         {
             "type": BotConfigTypes.LOG_FILE_NAME,
             "name": "log_file_name",
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.LOG_FILE_ENABLED),
+            "load_if": _IsLogFileEnabled,
         },
         {
             "type": BotConfigTypes.LOG_FILE_USE_ROTATING,
             "name": "log_file_use_rotating",
             "conv_fct": Utils.StrToBool,
-            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.LOG_FILE_ENABLED),
+            "load_if": _IsLogFileEnabled,
         },
         {
             "type": BotConfigTypes.LOG_FILE_APPEND,
@@ -21,7 +21,7 @@
 #
 # Imports
 #
-import time
+from typing import Iterable
 
 import pyrogram
 
@@ -31,19 +31,13 @@ from telegram_payment_bot.logger.logger import Logger
 from telegram_payment_bot.member.members_payment_getter import MembersPaymentGetter
 from telegram_payment_bot.member.members_username_getter import MembersUsernameGetter
 from telegram_payment_bot.misc.ban_helper import BanHelper
-from telegram_payment_bot.misc.chat_members import ChatMembersList
+from telegram_payment_bot.misc.chat_members import ChatMembersGetter, ChatMembersList
 
 
 #
 # Classes
 #
 
-# Constants for members kicker class
-class MembersKickerConst:
-    # Sleep time
-    SLEEP_TIME_SEC: float = 0.01
-
-
 # Members kicker class
 class MembersKicker:
 
@@ -69,10 +63,8 @@ class MembersKicker:
     # Kick all members with expired payment
     def KickAllWithExpiredPayment(self,
                                   chat: pyrogram.types.Chat) -> ChatMembersList:
-        no_payment_members = self.members_payment_getter.GetAllMembersWithExpiredPayment(chat)
-        if no_payment_members.Any():
-            self.__KickMultiple(chat, no_payment_members)
-        return no_payment_members
+        # Members are kicked while they are found, without building the full list first
+        return self.__KickMultiple(chat, self.members_payment_getter.IterMembersWithExpiredPayment(chat))
 
     # Kick single member if expired payment
     def KickSingleIfExpiredPayment(self,
@@ -86,10 +78,7 @@ class MembersKicker:
     # Kick all members with no username
     def KickAllWithNoUsername(self,
                               chat: pyrogram.types.Chat) -> ChatMembersList:
-        no_username_members = self.members_username_getter.GetAllWithNoUsername(chat)
-        if no_username_members.Any():
-            self.__KickMultiple(chat, no_username_members)
-        return no_username_members
+        return self.__KickMultiple(chat, self.members_username_getter.GetAllWithNoUsername(chat))
 
     # Kick single member if no username
     def KickSingleIfNoUsername(self,
@@ -105,17 +94,35 @@ class MembersKicker:
                      chat: pyrogram.types.Chat,
                      user: pyrogram.types.User) -> None:
         if not self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
-            self.ban_helper.KickUser(chat, user)
+            try:
+                self.ban_helper.KickUser(chat, user)
+            finally:
+                # Cached members are not valid anymore
+                ChatMembersGetter.InvalidateCache(chat)
         else:
             self.logger.GetLogger().info("Test mode ON: no member was kicked")
 
     # Kick multiple
     def __KickMultiple(self,
                        chat: pyrogram.types.Chat,
-                       members: ChatMembersList) -> None:
+                       members: Iterable[pyrogram.types.ChatMember]) -> ChatMembersList:
+        kicked_members = ChatMembersList()
+
+        # Collect members while they are consumed, so that kicking starts from the first one
+        def get_user(member: pyrogram.types.ChatMember) -> pyrogram.types.User:
+            kicked_members.AddSingle(member)
+            return member.user
+
         if not self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
-            for member in members:
-                self.ban_helper.KickUser(chat, member.user)
-                time.sleep(MembersKickerConst.SLEEP_TIME_SEC)
+            try:
+                self.ban_helper.KickUsersBulk(chat, map(get_user, members))
+            finally:
+                # Cached members are not valid anymore, even if only some of them were kicked
+                if kicked_members.Any():
+                    ChatMembersGetter.InvalidateCache(chat)
         else:
-            self.logger.GetLogger().info("Test mode ON: no member was kicked")
+            kicked_members.AddMultiple(list(members))
+            if kicked_members.Any():
+                self.logger.GetLogger().info("Test mode ON: no member was kicked")
+
+        return kicked_members
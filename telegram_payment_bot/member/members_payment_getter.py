@@ -21,7 +21,8 @@
 #
 # Imports
 #
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional
 
 import pyrogram
 
@@ -71,13 +72,9 @@ class MembersPaymentGetter:
     # Get all members with OK payment
     def GetAllMembersWithOkPayment(self,
                                    chat: pyrogram.types.Chat) -> ChatMembersList:
-        # Get all payments
-        payments = self.__GetAllPayments()
-
-        # Filter chat members
-        return ChatMembersGetter(self.client).FilterMembers(
+        return self.__FilterMembersByPayments(
             chat,
-            lambda member: (
+            lambda member, payments: (
                 MemberHelper.IsValidMember(member) and
                 member.user is not None and
                 member.user.username is not None and
@@ -88,17 +85,16 @@ class MembersPaymentGetter:
     # Get all members with expired payment
     def GetAllMembersWithExpiredPayment(self,
                                         chat: pyrogram.types.Chat) -> ChatMembersList:
-        # Get all payments
-        payments = self.__GetAllPayments()
-
-        # For safety: if no data was loaded, no user is expired
-        if payments.Empty():
-            return ChatMembersList()
-
-        # Filter chat members
-        return ChatMembersGetter(self.client).FilterMembers(
+        expired_members = ChatMembersList()
+        expired_members.AddMultiple(list(self.IterMembersWithExpiredPayment(chat)))
+        return expired_members
+
+    # Iterate over members with expired payment
+    def IterMembersWithExpiredPayment(self,
+                                      chat: pyrogram.types.Chat) -> Iterator[pyrogram.types.ChatMember]:
+        return self.__IterMembersByPayments(
             chat,
-            lambda member: (
+            lambda member, payments: (
                 MemberHelper.IsValidMember(member) and
                 member.user is not None and
                 (member.user.username is None or
@@ -110,17 +106,9 @@ class MembersPaymentGetter:
     def GetAllMembersWithExpiringPayment(self,
                                          chat: pyrogram.types.Chat,
                                          days: int) -> ChatMembersList:
-        # Get all payments
-        payments = self.__GetAllPayments()
-
-        # For safety: if no data was loaded, no user is expired
-        if payments.Empty():
-            return ChatMembersList()
-
-        # Filter chat members
-        return ChatMembersGetter(self.client).FilterMembers(
+        return self.__FilterMembersByPayments(
             chat,
-            lambda member: (
+            lambda member, payments: (
                 MemberHelper.IsValidMember(member) and
                 member.user is not None and
                 (member.user.username is None or
@@ -141,16 +129,47 @@ class MembersPaymentGetter:
     def IsSingleMemberExpired(self,
                               chat: pyrogram.types.Chat,
                               user: pyrogram.types.User) -> bool:
+        # Load payment in background while getting chat member, since they are independent
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            single_payment_future = executor.submit(self.__GetSinglePayment, user)
+            chat_members = ChatMembersGetter(self.client).GetSingle(chat, user)
+            single_payment = single_payment_future.result()
+
         # If the user is not in the chat, consider payment as not expired
-        chat_members = ChatMembersGetter(self.client).GetSingle(chat, user)
         if chat_members is None:
             return False
 
-        # Get single payment
-        single_payment = self.__GetSinglePayment(user)
         # If the user is not in the payment data, consider payment as expired
         return single_payment.IsExpired() if single_payment is not None else True
 
+    # Filter chat members by payments
+    def __FilterMembersByPayments(self,
+                                  chat: pyrogram.types.Chat,
+                                  filter_fct: Callable[[pyrogram.types.ChatMember, PaymentsData], bool]) -> ChatMembersList:
+        filtered_members = ChatMembersList()
+        filtered_members.AddMultiple(list(self.__IterMembersByPayments(chat, filter_fct)))
+        return filtered_members
+
+    # Iterate over chat members filtered by payments
+    def __IterMembersByPayments(self,
+                                chat: pyrogram.types.Chat,
+                                filter_fct: Callable[[pyrogram.types.ChatMember, PaymentsData], bool]
+                                ) -> Iterator[pyrogram.types.ChatMember]:
+        # Load payments in background while getting chat members, since they are independent
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            payments_future = executor.submit(self.__GetAllPayments)
+            chat_members = ChatMembersGetter(self.client).GetAll(chat)
+            payments = payments_future.result()
+
+        # For safety: if no data was loaded, no user is expired
+        if payments.Empty():
+            return
+
+        # Chat members are already ordered
+        for member in chat_members:
+            if filter_fct(member, payments):
+                yield member
+
     # Get all payments
     def __GetAllPayments(self) -> PaymentsData:
         # Load only the first time
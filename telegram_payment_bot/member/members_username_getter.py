@@ -21,6 +21,8 @@
 #
 # Imports
 #
+from typing import Tuple
+
 import pyrogram
 
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -48,25 +50,27 @@ class MembersUsernameGetter:
     # Get all with username
     def GetAllWithUsername(self,
                            chat: pyrogram.types.Chat) -> ChatMembersList:
-        # Filter chat members
-        return ChatMembersGetter(self.client).FilterMembers(
-            chat,
-            lambda member: (
-                MemberHelper.IsValidMember(member) and
-                member.user is not None and
-                member.user.username is not None
-            )
-        )
+        return self.PartitionByUsername(chat)[0]
 
     # Get all with no username
     def GetAllWithNoUsername(self,
                              chat: pyrogram.types.Chat) -> ChatMembersList:
-        # Filter chat members
-        return ChatMembersGetter(self.client).FilterMembers(
-            chat,
-            lambda member: (
-                MemberHelper.IsValidMember(member) and
-                member.user is not None and
-                member.user.username is None
-            )
-        )
+        return self.PartitionByUsername(chat)[1]
+
+    # Partition members in the ones with username and the ones with no username
+    def PartitionByUsername(self,
+                            chat: pyrogram.types.Chat) -> Tuple[ChatMembersList, ChatMembersList]:
+        with_username = ChatMembersList()
+        no_username = ChatMembersList()
+
+        # Get chat members only once (already ordered)
+        for member in ChatMembersGetter(self.client).GetAll(chat):
+            if not MemberHelper.IsValidMember(member) or member.user is None:
+                continue
+
+            if member.user.username is not None:
+                with_username.AddSingle(member)
+            else:
+                no_username.AddSingle(member)
+
+        return with_username, no_username
@@ -21,9 +21,14 @@
 #
 # Imports
 #
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
 import pyrogram
+from pyrogram.errors import FloodWait
 
 from telegram_payment_bot.utils.pyrogram_wrapper import PyrogramWrapper
+from telegram_payment_bot.utils.rate_limiter import RateLimiter
 
 
 #
@@ -34,11 +39,25 @@ from telegram_payment_bot.utils.pyrogram_wrapper import PyrogramWrapper
 class BanHelperConst:
     # Ban time in seconds
     BAN_TIME_SEC: int = 60
+    # Maximum number of users kicked at the same time
+    KICK_MAX_WORKERS: int = 30
+    # Overall rate limit (requests per time period in seconds)
+    OVERALL_MAX_RATE: int = 30
+    OVERALL_TIME_PERIOD_SEC: float = 1.0
+    # Rate limit for each chat (requests per time period in seconds)
+    CHAT_MAX_RATE: int = 20
+    CHAT_TIME_PERIOD_SEC: float = 1.0
 
 
 # Ban helper class
 class BanHelper:
 
+    # Shared by all instances, since limits are applied to the bot as a whole
+    rate_limiter: RateLimiter = RateLimiter(BanHelperConst.OVERALL_MAX_RATE,
+                                            BanHelperConst.OVERALL_TIME_PERIOD_SEC,
+                                            BanHelperConst.CHAT_MAX_RATE,
+                                            BanHelperConst.CHAT_TIME_PERIOD_SEC)
+
     client: pyrogram.Client
 
     # Constructor
@@ -58,10 +77,34 @@ class BanHelper:
                  user: pyrogram.types.User) -> None:
         # Ban only for 1 minute, so they can join again with an invite link if necessary
         # (otherwise they cannot join anymore, unless manually added to the group)
-        PyrogramWrapper.BanChatMember(self.client, chat, user, BanHelperConst.BAN_TIME_SEC)
+        self.__KickUserWithRetry(chat, user, BanHelperConst.BAN_TIME_SEC)
+
+    # Kick multiple users
+    def KickUsersBulk(self,
+                      chat: pyrogram.types.Chat,
+                      users: Iterable[pyrogram.types.User]) -> None:
+        # Telegram has no multi-user ban, so users are kicked concurrently to pipeline the requests
+        # (the rate limiter keeps them within Telegram limits)
+        with ThreadPoolExecutor(max_workers=BanHelperConst.KICK_MAX_WORKERS) as executor:
+            # Consume results to propagate exceptions
+            list(executor.map(lambda user: self.KickUser(chat, user), users))
 
     # Unban user
     def UnbanUser(self,
                   chat: pyrogram.types.Chat,
                   user: pyrogram.types.User) -> None:
         self.client.unban_chat_member(chat.id, user.id)
+
+    # Kick user, retrying after the time requested by Telegram in case of flood wait
+    def __KickUserWithRetry(self,
+                            chat: pyrogram.types.Chat,
+                            user: pyrogram.types.User,
+                            time_sec: int) -> None:
+        while True:
+            self.rate_limiter.Acquire(chat.id)
+            try:
+                PyrogramWrapper.BanChatMember(self.client, chat, user, time_sec)
+                return
+            except FloodWait as ex:
+                # Block the shared limiter, so that all threads wait instead of only the current one
+                self.rate_limiter.BlockFor(PyrogramWrapper.FloodWaitTime(ex))
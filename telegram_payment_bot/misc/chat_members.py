@@ -21,7 +21,9 @@
 #
 # Imports
 #
-from typing import Callable, Optional
+import time
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pyrogram
 
@@ -69,9 +71,19 @@ class ChatMembersList(WrappedList):
         return self.ToString()
 
 
+# Constants for chat members getter class
+class ChatMembersGetterConst:
+    # Time-to-live of cached members in seconds
+    CACHE_TTL_SEC: float = 30.0
+
+
 # Chat members getter class
 class ChatMembersGetter:
 
+    # Cache shared by all instances, indexed by (chat ID, filter string)
+    members_cache: Dict[Tuple[int, str], Tuple[float, List[pyrogram.types.ChatMember]]] = {}
+    members_cache_lock: Lock = Lock()
+
     client: pyrogram.Client
 
     # Constructor
@@ -83,9 +95,10 @@ class ChatMembersGetter:
     def FilterMembers(self,
                       chat: pyrogram.types.Chat,
                       filter_fct: Optional[Callable[[pyrogram.types.ChatMember], bool]] = None,
-                      filter_str: str = "all") -> ChatMembersList:
+                      filter_str: str = "all",
+                      use_cache: bool = True) -> ChatMembersList:
         # Get members
-        filtered_members = list(PyrogramWrapper.GetChatMembers(self.client, chat, filter_str))
+        filtered_members = self.__GetMembers(chat, filter_str, use_cache)
         # Filter them if necessary
         if filter_fct is not None:
             filtered_members = list(filter(filter_fct, filtered_members))   # type: ignore
@@ -109,7 +122,10 @@ class ChatMembersGetter:
     def GetSingle(self,
                   chat: pyrogram.types.Chat,
                   user: pyrogram.types.User) -> ChatMembersList:
-        return self.FilterMembers(chat, lambda member: member.user is not None and user.id == member.user.id)
+        # Do not use cache, since the user may have just joined
+        return self.FilterMembers(chat,
+                                  lambda member: member.user is not None and user.id == member.user.id,
+                                  use_cache=False)
 
     # Get admins
     def GetAdmins(self,
@@ -117,3 +133,29 @@ class ChatMembersGetter:
         return self.FilterMembers(chat,
                                   lambda member: True,
                                   "administrators")
+
+    # Invalidate cached members of the specified chat
+    @staticmethod
+    def InvalidateCache(chat: pyrogram.types.Chat) -> None:
+        with ChatMembersGetter.members_cache_lock:
+            for key in [key for key in ChatMembersGetter.members_cache if key[0] == chat.id]:
+                del ChatMembersGetter.members_cache[key]
+
+    # Get members, from cache if still valid
+    def __GetMembers(self,
+                     chat: pyrogram.types.Chat,
+                     filter_str: str,
+                     use_cache: bool) -> List[pyrogram.types.ChatMember]:
+        cache_key = (chat.id, filter_str)
+
+        if use_cache:
+            with ChatMembersGetter.members_cache_lock:
+                cache_entry = ChatMembersGetter.members_cache.get(cache_key)
+            if cache_entry is not None and time.monotonic() - cache_entry[0] < ChatMembersGetterConst.CACHE_TTL_SEC:
+                return list(cache_entry[1])
+
+        members = list(PyrogramWrapper.GetChatMembers(self.client, chat, filter_str))
+        with ChatMembersGetter.members_cache_lock:
+            ChatMembersGetter.members_cache[cache_key] = (time.monotonic(), members)
+
+        return list(members)
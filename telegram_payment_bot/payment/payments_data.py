@@ -25,7 +25,7 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum, auto, unique
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.config.config_object import ConfigObject
@@ -150,43 +150,80 @@ class PaymentsDataErrors(WrappedList):
 class PaymentsData(WrappedDict):
 
     config: ConfigObject
+    emails: Dict[str, SinglePayment]
 
     # Constructor
     def __init__(self,
                  config: ConfigObject) -> None:
         super().__init__()
         self.config = config
+        self.emails = {}
+
+    # Add single element
+    def AddSingle(self,
+                  key: Any,
+                  value: SinglePayment) -> None:
+        old_payment = self.dict_elements.get(key)
+        # Assign in place, so that the key keeps its position if already present
+        super().AddSingle(key, value)
+        if old_payment is not None:
+            old_email = old_payment.Email()
+            if self.emails.get(old_email) is old_payment:
+                self.__ReindexEmail(old_email)
+        self.emails.setdefault(value.Email(), value)
+
+    # Add multiple elements
+    def AddMultiple(self,
+                    elements: Union[Dict[Any, SinglePayment], WrappedDict]) -> None:
+        for key, value in (elements.Items() if isinstance(elements, WrappedDict) else elements.items()):
+            self.AddSingle(key, value)
+
+    # Remove single element
+    def RemoveSingle(self,
+                     key: Any) -> None:
+        payment = self.dict_elements.pop(key, None)
+        if payment is None:
+            return
+
+        email = payment.Email()
+        if self.emails.get(email) is payment:
+            self.__ReindexEmail(email)
+
+    # Clear element
+    def Clear(self) -> None:
+        super().Clear()
+        self.emails.clear()
 
     # Add payment
     def AddPayment(self,
                    email: str,
                    user: User,
                    expiration: datetime.date) -> bool:
-        # User shall not be existent
-        if not self.IsUserExistent(user):
-            # Check for duplicated email if configured
-            if self.config.GetValue(BotConfigTypes.PAYMENT_CHECK_DUP_EMAIL):
-                if email != "" and self.IsEmailExistent(email):
-                    return False
-            self.AddSingle(user.GetAsKey(), SinglePayment(email, user, expiration))
-            return True
+        # User shall not be existent (compute the key only once, since this is called for each loaded row)
+        user_key = user.GetAsKey()
+        if user_key in self.dict_elements:
+            return False
 
-        return False
+        # Check for duplicated email if configured
+        if self.config.GetValue(BotConfigTypes.PAYMENT_CHECK_DUP_EMAIL):
+            if email != "" and email in self.emails:
+                return False
+
+        payment = SinglePayment(email, user, expiration)
+        self.dict_elements[user_key] = payment
+        self.emails.setdefault(email, payment)
+        return True
 
     # Get by email
     def GetByEmail(self,
                    email: str) -> Optional[SinglePayment]:
-        for _, payment in self.dict_elements.items():
-            if email == payment.Email():
-                return payment
-        return None
+        return self.emails.get(email)
 
     # Get by user
     def GetByUser(self,
                   user: User) -> Optional[SinglePayment]:
-        if not user.IsValid() or user.GetAsKey() not in self.dict_elements:
-            return None
-        return self.dict_elements[user.GetAsKey()]
+        # Keys are lowercase usernames (without "@") or user IDs, so a single lookup is enough
+        return self.dict_elements.get(user.GetAsKey()) if user.IsValid() else None
 
     # Get if email is existent
     def IsEmailExistent(self,
@@ -238,6 +275,19 @@ class PaymentsData(WrappedDict):
 
         return payments
 
+    # Set item
+    def __setitem__(self,
+                    key: Any,
+                    value: SinglePayment):
+        self.AddSingle(key, value)
+
+    # Delete item
+    def __delitem__(self,
+                    key: Any):
+        if key not in self.dict_elements:
+            raise KeyError(key)
+        self.RemoveSingle(key)
+
     # Convert to string
     def ToString(self) -> str:
         return "\n".join(
@@ -247,3 +297,12 @@ class PaymentsData(WrappedDict):
     # Convert to string
     def __str__(self) -> str:
         return self.ToString()
+
+    # Index the first payment with the specified email if any (more than one only if duplicated emails are allowed)
+    def __ReindexEmail(self,
+                       email: str) -> None:
+        self.emails.pop(email, None)
+        for payment in self.dict_elements.values():
+            if payment.Email() == email:
+                self.emails[email] = payment
+                break
@@ -21,10 +21,14 @@
 #
 # Imports
 #
-from datetime import datetime
-from typing import Any, Optional, Tuple
+import os
+from datetime import date, datetime, timedelta
+from itertools import islice
+from operator import itemgetter
+from threading import Lock
+from typing import Any, List, Optional, Tuple
 
-import xlrd
+from python_calamine import CalamineWorkbook
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
 from telegram_payment_bot.misc.user import User
@@ -42,10 +46,17 @@ from telegram_payment_bot.payment.payments_loader_base import PaymentsLoaderBase
 class PaymentsExcelLoaderConst:
     # Sheet index
     SHEET_IDX: int = 0
+    # Base date for dates stored as numbers
+    EXCEL_BASE_DATE: datetime = datetime(1899, 12, 30)
 
 
 # Payments Excel loader class
 class PaymentsExcelLoader(PaymentsLoaderBase):
+
+    # Cache shared by all instances: (file name, modification time, payments data, payments errors)
+    payments_cache: Optional[Tuple[str, int, PaymentsData, PaymentsDataErrors]] = None
+    payments_cache_lock: Lock = Lock()
+
     # Load all payments
     def LoadAll(self) -> PaymentsData:
         return self.__LoadAndCheckAll()[0]
@@ -65,29 +76,42 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
         payment_file = self.config.GetValue(BotConfigTypes.PAYMENT_EXCEL_FILE)
 
         try:
+            # Use cached data if the file was not modified since last loading
+            mtime_ns = os.stat(payment_file).st_mtime_ns
+            with PaymentsExcelLoader.payments_cache_lock:
+                payments_cache = PaymentsExcelLoader.payments_cache
+            if payments_cache is not None and payments_cache[0] == payment_file and payments_cache[1] == mtime_ns:
+                self.logger.GetLogger().debug(f"File \"{payment_file}\" not modified, using cached data")
+                return payments_cache[2], payments_cache[3]
+
             # Log
             self.logger.GetLogger().info(f"Loading file \"{payment_file}\"...")
 
-            # Get sheet
-            sheet = self.__GetSheet(payment_file)
+            # Get sheet rows
+            rows = self.__GetSheetRows(payment_file)
             # Load sheet
-            payments_data, payments_data_err = self.__LoadSheet(sheet)
+            payments_data, payments_data_err = self.__LoadSheet(rows)
 
             # Log
             self.logger.GetLogger().info(
                 f"File \"{payment_file}\" successfully loaded, number of rows: {payments_data.Count()}"
             )
 
+            with PaymentsExcelLoader.payments_cache_lock:
+                PaymentsExcelLoader.payments_cache = (payment_file, mtime_ns, payments_data, payments_data_err)
+
             return payments_data, payments_data_err
 
         # Catch everything and log exception
         except Exception:
+            with PaymentsExcelLoader.payments_cache_lock:
+                PaymentsExcelLoader.payments_cache = None
             self.logger.GetLogger().exception(f"An error occurred while loading file \"{payment_file}\"")
             raise
 
     # Load sheet
     def __LoadSheet(self,
-                    sheet: xlrd.sheet.Sheet) -> Tuple[PaymentsData, PaymentsDataErrors]:
+                    rows: List[List[Any]]) -> Tuple[PaymentsData, PaymentsDataErrors]:
         payments_data = PaymentsData(self.config)
         payments_data_err = PaymentsDataErrors()
 
@@ -95,19 +119,27 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
         email_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EMAIL_COL))
         user_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_USER_COL))
         expiration_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EXPIRATION_COL))
+        # Get date format
+        date_format = self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)
 
-        # Read each row
-        for i in range(sheet.nrows):
-            # Skip header (first row)
-            if i > 0:
-                # Get cell values
-                email = str(sheet.cell_value(i, email_col_idx)).strip()
-                user = User.FromString(self.config, str(sheet.cell_value(i, user_col_idx)).strip())
-                expiration = sheet.cell_value(i, expiration_col_idx)
+        # Get the cells of all columns with a single call for each row
+        get_cells = itemgetter(email_col_idx, user_col_idx, expiration_col_idx)
 
+        # Read each row, skipping header (first row)
+        for row_idx, row in enumerate(islice(rows, 1, None), start=2):
+            try:
+                # Get cell values
+                email, user_str, expiration = get_cells(row)
+            except IndexError:
+                self.logger.GetLogger().warning(
+                    f"Row index {row_idx} is not valid (some fields are missing), skipping it..."
+                )
+            else:
+                user = User.FromString(self.config, self.__CellToStr(user_str))
                 # Skip invalid users
                 if user.IsValid():
-                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration)
+                    self.__AddPayment(row_idx, payments_data, payments_data_err,
+                                      self.__CellToStr(email), user, expiration, date_format)
 
         return payments_data, payments_data_err
 
@@ -118,14 +150,18 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
                      payments_data_err: PaymentsDataErrors,
                      email: str,
                      user: User,
-                     expiration: Any) -> None:
-        # In Excel, a date can be a number or a string
-        try:
-            expiration_datetime = xlrd.xldate_as_datetime(expiration, 0).date()
-        except TypeError:
+                     expiration: Any,
+                     date_format: str) -> None:
+        # In Excel, a date can be a date, a number or a string
+        if isinstance(expiration, datetime):
+            expiration_datetime = expiration.date()
+        elif isinstance(expiration, date):
+            expiration_datetime = expiration
+        elif isinstance(expiration, (int, float)):
+            expiration_datetime = (PaymentsExcelLoaderConst.EXCEL_BASE_DATE + timedelta(days=expiration)).date()
+        else:
             try:
-                expiration_datetime = datetime.strptime(expiration.strip(),
-                                                        self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)).date()
+                expiration_datetime = self._StrToDate(str(expiration).strip(), date_format)
             except ValueError:
                 self.logger.GetLogger().warning(
                     f"Expiration date for user {user} at row {row_idx} is not valid ({expiration}), skipped"
@@ -151,9 +187,20 @@ class PaymentsExcelLoader(PaymentsLoaderBase):
                                               row_idx,
                                               user)
 
-    # Get sheet
-    def __GetSheet(self,
-                   payment_file: str) -> xlrd.sheet.Sheet:
+    # Get sheet rows
+    def __GetSheetRows(self,
+                       payment_file: str) -> List[List[Any]]:
         # Open file
-        wb = xlrd.open_workbook(payment_file)
-        return wb.sheet_by_index(self.config.GetValue(BotConfigTypes.PAYMENT_WORKSHEET_IDX))
+        wb = CalamineWorkbook.from_path(payment_file)
+        sheet = wb.get_sheet_by_index(self.config.GetValue(BotConfigTypes.PAYMENT_WORKSHEET_IDX))
+        # Keep empty area, so that rows and columns are aligned to the configured indexes
+        return sheet.to_python(skip_empty_area=False)
+
+    # Convert cell value to string
+    @staticmethod
+    def __CellToStr(cell: Any) -> str:
+        # Numbers are read as float, so convert integer ones (e.g. user IDs) without decimals,
+        # otherwise User would fail to parse them as integer before trying as float
+        if isinstance(cell, float) and cell.is_integer():
+            return str(int(cell))
+        return cell.strip() if isinstance(cell, str) else str(cell).strip()
@@ -20,7 +20,6 @@
 #
 # Imports
 #
-from datetime import datetime
 from typing import Optional, Tuple
 
 from telegram_payment_bot.bot.bot_config_types import BotConfigTypes
@@ -87,6 +86,8 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
         email_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EMAIL_COL))
         user_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_USER_COL))
         expiration_col_idx = self._ColumnToIndex(self.config.GetValue(BotConfigTypes.PAYMENT_EXPIRATION_COL))
+        # Get date format
+        date_format = self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)
 
         # Get all rows
         rows = self.google_sheet_rows_getter.GetRows(
@@ -111,7 +112,7 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
             else:
                 # Skip invalid users
                 if user.IsValid():
-                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration)
+                    self.__AddPayment(i + 1, payments_data, payments_data_err, email, user, expiration, date_format)
 
         return payments_data, payments_data_err
 
@@ -122,11 +123,11 @@ class PaymentsGoogleSheetLoader(PaymentsLoaderBase):
                      payments_data_err: PaymentsDataErrors,
                      email: str,
                      user: User,
-                     expiration: str) -> None:
+                     expiration: str,
+                     date_format: str) -> None:
         # Convert date to datetime object
         try:
-            expiration_datetime = datetime.strptime(expiration,
-                                                    self.config.GetValue(BotConfigTypes.PAYMENT_DATE_FORMAT)).date()
+            expiration_datetime = self._StrToDate(expiration, date_format)
         except ValueError:
             self.logger.GetLogger().warning(
                 f"Expiration date for user {user} at row {row_idx} is not valid ({expiration}), skipped"
@@ -21,8 +21,10 @@
 #
 # Imports
 #
+import re
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, Pattern
 
 from telegram_payment_bot.config.config_object import ConfigObject
 from telegram_payment_bot.logger.logger import Logger
@@ -34,6 +36,13 @@ from telegram_payment_bot.payment.payments_data import PaymentsData, PaymentsDat
 # Classes
 #
 
+# Constants for payments loader base class
+class PaymentsLoaderBaseConst:
+    # Default date format and corresponding regex, used for parsing it faster
+    DEF_DATE_FORMAT: str = "%d/%m/%Y"
+    DEF_DATE_FORMAT_REGEX: Pattern = re.compile(r"([0-9]{2})/([0-9]{2})/([0-9]{4})")
+
+
 # Payments loader base class
 class PaymentsLoaderBase(ABC):
 
@@ -67,3 +76,14 @@ class PaymentsLoaderBase(ABC):
     @staticmethod
     def _ColumnToIndex(col: str) -> int:
         return ord(col) - ord("A")
+
+    # Convert date string to date
+    @staticmethod
+    def _StrToDate(date_str: str,
+                   date_format: str) -> date:
+        # Avoid parsing the format string each time if it is the default one
+        if date_format == PaymentsLoaderBaseConst.DEF_DATE_FORMAT:
+            match = PaymentsLoaderBaseConst.DEF_DATE_FORMAT_REGEX.fullmatch(date_str)
+            if match is not None:
+                return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        return datetime.strptime(date_str, date_format).date()
@@ -32,11 +32,14 @@ from typing import Any, Dict
 class KeyValueConverter:
 
     kv_dict: Dict[str, Any]
+    vk_dict: Dict[Any, str]
 
     # Constructor
     def __init__(self,
                  kv_dict: Dict[str, Any]) -> None:
         self.kv_dict = kv_dict
+        # Reversed, so that the first key is kept in case of duplicated values
+        self.vk_dict = {v: k for k, v in reversed(list(kv_dict.items()))}
 
     # Convert key to value
     def KeyToValue(self,
@@ -46,5 +49,4 @@ class KeyValueConverter:
     # Convert value to key
     def ValueToKey(self,
                    value: Any) -> str:
-        idx = list(self.kv_dict.values()).index(value)
-        return list(self.kv_dict.keys())[idx]
+        return self.vk_dict[value]
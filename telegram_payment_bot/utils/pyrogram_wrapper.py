@@ -68,6 +68,15 @@ class PyrogramWrapper:
                                         user.id,
                                         until_date=int(time.time() + time_sec))
 
+    # Get flood wait time in seconds
+    @staticmethod
+    def FloodWaitTime(ex: pyrogram.errors.FloodWait) -> int:
+        if PyrogramWrapper.__MajorVersion() == 2:
+            return ex.value
+        if PyrogramWrapper.__MajorVersion() == 1:
+            return ex.x
+        raise RuntimeError("Unsupported pyrogram version")
+
     # Get if member is status
     @staticmethod
     def MemberIsStatus(member: pyrogram.types.ChatMember,
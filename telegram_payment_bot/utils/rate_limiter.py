@@ -0,0 +1,127 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#
+# Imports
+#
+import time
+from threading import Lock
+from typing import Dict
+
+
+#
+# Classes
+#
+
+# Token bucket class
+class TokenBucket:
+
+    max_rate: int
+    time_period: float
+    tokens: float
+    last_time: float
+    lock: Lock
+
+    # Constructor
+    def __init__(self,
+                 max_rate: int,
+                 time_period: float) -> None:
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.tokens = max_rate
+        self.last_time = time.monotonic()
+        self.lock = Lock()
+
+    # Acquire a token, waiting until one is available
+    def Acquire(self) -> None:
+        while True:
+            with self.lock:
+                self.__Refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) * self.time_period / self.max_rate
+            time.sleep(wait_time)
+
+    # Refill tokens depending on the elapsed time
+    def __Refill(self) -> None:
+        curr_time = time.monotonic()
+        self.tokens = min(self.max_rate,
+                          self.tokens + (curr_time - self.last_time) * self.max_rate / self.time_period)
+        self.last_time = curr_time
+
+
+# Rate limiter class (overall and per chat)
+class RateLimiter:
+
+    chat_max_rate: int
+    chat_time_period: float
+    overall_bucket: TokenBucket
+    chat_buckets: Dict[int, TokenBucket]
+    chat_buckets_lock: Lock
+    blocked_until: float
+    blocked_until_lock: Lock
+
+    # Constructor
+    def __init__(self,
+                 overall_max_rate: int,
+                 overall_time_period: float,
+                 chat_max_rate: int,
+                 chat_time_period: float) -> None:
+        self.chat_max_rate = chat_max_rate
+        self.chat_time_period = chat_time_period
+        self.overall_bucket = TokenBucket(overall_max_rate, overall_time_period)
+        self.chat_buckets = {}
+        self.chat_buckets_lock = Lock()
+        self.blocked_until = 0.0
+        self.blocked_until_lock = Lock()
+
+    # Acquire for the specified chat, waiting until both limits allow it
+    def Acquire(self,
+                chat_id: int) -> None:
+        # Wait for the chat limit first, to avoid holding an overall token meanwhile
+        self.__GetChatBucket(chat_id).Acquire()
+        self.overall_bucket.Acquire()
+        # Checked last, so that also threads that were waiting for tokens respect the block
+        self.__WaitIfBlocked()
+
+    # Block all acquisitions for the specified time (e.g. flood wait requested by Telegram)
+    def BlockFor(self,
+                 time_sec: float) -> None:
+        with self.blocked_until_lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + time_sec)
+
+    # Get chat bucket
+    def __GetChatBucket(self,
+                        chat_id: int) -> TokenBucket:
+        with self.chat_buckets_lock:
+            if chat_id not in self.chat_buckets:
+                self.chat_buckets[chat_id] = TokenBucket(self.chat_max_rate, self.chat_time_period)
+            return self.chat_buckets[chat_id]
+
+    # Wait until acquisitions are not blocked anymore
+    def __WaitIfBlocked(self) -> None:
+        while True:
+            with self.blocked_until_lock:
+                wait_time = self.blocked_until - time.monotonic()
+            # Block may be extended meanwhile, so check again after waiting
+            if wait_time <= 0:
+                return
+            time.sleep(wait_time)